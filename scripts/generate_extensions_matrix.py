@@ -7,6 +7,7 @@ that can be used by GitHub Actions workflows to dynamically test extensions.
 
 This script requires the following packages:
 - requests
+- requests-cache
 - pyyaml
 
 This script makes some assumptions about each NDX record repo:
@@ -19,20 +20,74 @@ and updated regularly as issues are addressed and new issues arise.
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
 import sys
-from typing import Dict, List, Optional, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Any
 
 import requests
+import requests_cache
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # libyaml-backed loader parses ~5-10x faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    # C-implemented JSON codec; stdlib json is used when unavailable
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration constants
 CATALOG_API_URL = "https://api.github.com/orgs/nwb-extensions/repos"
+GRAPHQL_API_URL = "https://api.github.com/graphql"
+RATE_LIMIT_API_URL = "https://api.github.com/rate_limit"
 DEFAULT_PER_PAGE = 100
 
+# Back off when fewer than this many rate-limit requests remain
+MIN_RATE_LIMIT_REMAINING = 5
+
+# Maximum number of repositories to combine into one GraphQL query
+GRAPHQL_BATCH_SIZE = 100
+
+# How long cached HTTP responses stay fresh without revalidation (seconds)
+CACHE_EXPIRE_AFTER = 3600
+
+# Parsed ndx-meta.yaml entries keyed by git blob SHA, reused across runs
+BLOB_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nwb-ext-matrix", "blobs.json"
+)
+
+# Last generated matrix plus the digest of upstream state it was built from
+MATRIX_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nwb-ext-matrix", "matrix.json"
+)
+
+# The only ndx-meta.yaml keys the matrix needs; the files are auto-generated
+# flat key: value documents, so a line-anchored regex extracts them without a
+# full YAML parse
+META_FIELD_PATTERNS = {
+    "name": re.compile(r"^name:\s*(\S+)\s*$", re.MULTILINE),
+    "src": re.compile(r"^src:\s*(\S+)\s*$", re.MULTILINE),
+    "pip": re.compile(r"^pip:\s*(\S+)\s*$", re.MULTILINE),
+}
+
+# Connection pool size for the shared session, and the maximum number of
+# worker threads fetching metadata files concurrently
+MAX_CONNECTIONS = 20
+MAX_CONCURRENT_FETCHES = 16
+
 # Set of extensions with known issues when installing from source
-INACTIVE_EXTENSIONS = {
+INACTIVE_EXTENSIONS: FrozenSet[str] = frozenset({
     "ndx-simulation-output",  # Not compatible with latest HDMF because of ImportError: cannot import name 'call_docval_func' from 'hdmf.utils'
     "ndx-ecog",  # Requires Python <3.9 because of ImportError: cannot import name 'Iterable' from 'collections'
     "ndx-icephys-meta",  # Deprecated, use NWB core
@@ -49,7 +104,7 @@ INACTIVE_EXTENSIONS = {
     "ndx-depth-moseq",  # Not compatible with latest HDMF because of requirement hdmf<4
     "ndx-hed",  # Not yet resolved ModuleNotFoundError: No module named 'ndx_events'
     "ndx-microscopy",  # Not yet resolved ValueError: 'DeviceModel' - cannot overwrite existing specification
-}
+})
 
 # List of results to return if fetching from the NDX Catalog failed
 FALLBACK_EXTENSIONS = [
@@ -88,110 +143,522 @@ FALLBACK_EXTENSIONS = [
 
 def get_github_headers() -> Dict[str, str]:
     """Get headers for GitHub API requests with authentication if token is available."""
-    headers = {}
+    # Ask for compressed responses explicitly; listing pages are ~10x smaller
+    # on the wire gzipped
+    headers = {"Accept-Encoding": "gzip"}
     github_token = os.getenv('GITHUB_TOKEN')
     if github_token:
-        headers = {
+        headers.update({
             "Accept": "application/vnd.github+json",
             "Authorization": f"Bearer {github_token}",
-        }
+        })
         print("Using GitHub token for authenticated requests", file=sys.stderr)
     else:
         print("No GitHub token found - using unauthenticated requests", file=sys.stderr)
     return headers
 
 
-def get_extension_record_repos() -> List[Dict[str, Any]]:
-    """Get all extension record repositories using pagination."""
-    all_repos = []
-    page = 1
-    headers = get_github_headers()
+def decode_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def dump_compact_json(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def check_rate_limit_headers(response: requests.Response) -> None:
+    """Sleep until the rate-limit window resets if few requests remain.
+
+    Backing off proactively avoids spending round trips on requests that
+    would only come back as 403s once the quota is exhausted.
+    """
+    try:
+        remaining = int(response.headers["X-RateLimit-Remaining"])
+        reset_ts = int(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return
+
+    if remaining < MIN_RATE_LIMIT_REMAINING:
+        wait_seconds = max(0, reset_ts - time.time())
+        print(
+            f"Warning: only {remaining} rate-limit requests remaining; "
+            f"sleeping {wait_seconds:.0f}s until reset",
+            file=sys.stderr,
+        )
+        time.sleep(wait_seconds)
+
+
+def get_metadata_fetch_concurrency(session: requests.Session) -> int:
+    """Choose metadata-fetch concurrency based on the remaining rate limit.
+
+    Querying GET /rate_limit is cheap (it does not count against the quota).
+    Unauthenticated runs get only 60 requests/hour, so fetch serially to
+    avoid burning through the quota; authenticated runs can fan out.
+    """
+    try:
+        response = session.get(RATE_LIMIT_API_URL)
+        response.raise_for_status()
+        core = decode_json_response(response)["resources"]["core"]
+        remaining = int(core["remaining"])
+        limit = int(core["limit"])
+    except (requests.RequestException, KeyError, ValueError) as e:
+        print(f"Warning: Could not query rate limit, fetching serially: {e}", file=sys.stderr)
+        return 1
+
+    if limit <= 60 or remaining < MAX_CONCURRENT_FETCHES:
+        return 1
+    return MAX_CONCURRENT_FETCHES
+
+
+def make_cached_session() -> requests_cache.CachedSession:
+    """Create an HTTP session backed by an on-disk cache honoring ETag/Cache-Control.
+
+    Cached responses are revalidated with conditional GETs, so unchanged
+    catalog pages come back as bodiless 304s, saving bandwidth and rate-limit
+    quota across runs. The cache lives under $RUNNER_TEMP on GitHub Actions so
+    it can be persisted between runs with actions/cache.
+
+    The session carries the GitHub auth headers and pools connections to both
+    GitHub hosts, so one session shared across all calls reuses TCP+TLS
+    connections instead of handshaking per request, with retries on
+    transient errors.
+    """
+    cache_dir = os.getenv("RUNNER_TEMP", ".")
+    session = requests_cache.CachedSession(
+        cache_name=os.path.join(cache_dir, ".gh-cache"),
+        backend="sqlite",
+        expire_after=CACHE_EXPIRE_AFTER,
+        cache_control=True,
+    )
+    session.headers.update(get_github_headers())
+
+    adapter = HTTPAdapter(
+        pool_connections=MAX_CONNECTIONS,
+        pool_maxsize=MAX_CONNECTIONS,
+        max_retries=Retry(total=5, backoff_factor=1, status_forcelist=[429, 502, 503, 504]),
+    )
+    session.mount("https://api.github.com", adapter)
+    session.mount("https://raw.githubusercontent.com", adapter)
+    return session
+
+
+def iter_extension_record_repos_via_graphql(session: requests.Session) -> Iterator[Dict[str, Any]]:
+    """Yield extension record repositories from a server-side filtered GraphQL listing.
+
+    The search filter narrows results to repos matching "ndx-" on the server
+    (search syntax treats a leading "-" as negation, so "-record" cannot be
+    part of the filter), and the client-side suffix check below selects the
+    record repos. Fewer pages are fetched and less JSON is parsed than when
+    listing the entire org over REST, and repos are yielded as each page
+    arrives so consumers can start work before the listing completes.
+    """
+    query = """
+    query($cursor: String) {
+      organization(login: "nwb-extensions") {
+        repositories(first: 100, after: $cursor, query: "ndx-") {
+          pageInfo { endCursor hasNextPage }
+          nodes { name defaultBranchRef { name } }
+        }
+      }
+    }
+    """
 
+    cursor = None
     while True:
-        params = {'per_page': DEFAULT_PER_PAGE, 'page': page}
+        response = session.post(
+            GRAPHQL_API_URL,
+            json={"query": query, "variables": {"cursor": cursor}},
+        )
+        response.raise_for_status()
+        check_rate_limit_headers(response)
+        data = decode_json_response(response)
+
+        if data.get("errors"):
+            raise RuntimeError(f"GraphQL repository listing returned errors: {data['errors']}")
+
+        repositories = data["data"]["organization"]["repositories"]
+        for node in repositories["nodes"]:
+            # Defensive check in case the server-side query matches too broadly
+            if not (node["name"].startswith("ndx-") and node["name"].endswith("-record")):
+                continue
+            default_branch_ref = node.get("defaultBranchRef") or {}
+            yield {
+                "name": node["name"],
+                "html_url": f"https://github.com/nwb-extensions/{node['name']}",
+                "default_branch": default_branch_ref.get("name", "main"),
+            }
+
+        page_info = repositories["pageInfo"]
+        if not page_info["hasNextPage"]:
+            break
+        cursor = page_info["endCursor"]
+
 
+def iter_extension_record_repos_via_rest(session: requests.Session) -> Iterator[Dict[str, Any]]:
+    """Yield extension record repositories from the paginated REST org listing."""
+    next_url = CATALOG_API_URL
+    params = {'per_page': DEFAULT_PER_PAGE}
+
+    while next_url:
         try:
-            response = requests.get(CATALOG_API_URL, headers=headers, params=params)
+            response = session.get(next_url, params=params)
             response.raise_for_status()
+            check_rate_limit_headers(response)
         except requests.RequestException as e:
-            print(f"Error: Failed to fetch repos from {CATALOG_API_URL}: {e}", file=sys.stderr)
+            print(f"Error: Failed to fetch repos from {next_url}: {e}", file=sys.stderr)
             raise
 
-        repos = response.json()
-        if not repos:  # No more pages
-            break
-
         # Filter for extension record repositories
-        record_repos = [
-            repo for repo in repos
-            if repo["name"].startswith("ndx-") and repo["name"].endswith("-record")
-        ]
-        all_repos.extend(record_repos)
-
-        # Check if we've reached the last page
-        if len(repos) < DEFAULT_PER_PAGE:
-            break
+        for repo in decode_json_response(response):
+            if repo["name"].startswith("ndx-") and repo["name"].endswith("-record"):
+                yield repo
+
+        # GitHub encodes the end of the listing in the Link header; follow
+        # rel="next" until it is absent (its URL carries the query params)
+        next_url = response.links.get("next", {}).get("url")
+        params = None
+
+
+def iter_extension_record_repos(session: requests.Session) -> Iterator[Dict[str, Any]]:
+    """Yield extension record repositories page by page as the listing paginates."""
+    # The GraphQL listing filters by name server-side but requires a token
+    if "Authorization" in session.headers:
+        yielded = False
+        try:
+            for repo in iter_extension_record_repos_via_graphql(session):
+                yielded = True
+                yield repo
+        except (requests.RequestException, RuntimeError, KeyError) as e:
+            if yielded:
+                # Partial results have already been consumed; restarting over
+                # REST would duplicate them
+                raise
+            print(f"Warning: GraphQL listing failed, falling back to REST: {e}", file=sys.stderr)
+        else:
+            if yielded:
+                return
+            # Zero repos more likely means the server-side filter matched
+            # nothing than an org without record repos; let REST decide
+            print("Warning: GraphQL listing returned no record repos, falling back to REST", file=sys.stderr)
+
+    yield from iter_extension_record_repos_via_rest(session)
 
-        page += 1
 
+def get_extension_record_repos(session: requests.Session) -> List[Dict[str, Any]]:
+    """Get all extension record repositories using pagination."""
+    all_repos = list(iter_extension_record_repos(session))
     print(f"Found {len(all_repos)} NWB extension record repositories", file=sys.stderr)
     return all_repos
 
 
-def fetch_extension_metadata(repo: Dict[str, Any], headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
-    """Fetch extension metadata from ndx-meta.yaml file."""
-    repo_name = repo["name"]
-    repo_url = repo["html_url"]
-    default_branch = repo.get("default_branch", "main")
+def load_blob_cache() -> Dict[str, Dict[str, Any]]:
+    """Load the blob-SHA-keyed cache of parsed ndx-meta.yaml entries."""
+    try:
+        with open(BLOB_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
 
-    raw_url = f"https://raw.githubusercontent.com/nwb-extensions/{repo_name}/{default_branch}/ndx-meta.yaml"
 
+def save_blob_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    """Persist the blob-SHA-keyed cache of parsed ndx-meta.yaml entries."""
     try:
-        response = requests.get(raw_url, headers=headers)
-        response.raise_for_status()
+        os.makedirs(os.path.dirname(BLOB_CACHE_PATH), exist_ok=True)
+        with open(BLOB_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: Could not save blob cache to {BLOB_CACHE_PATH}: {e}", file=sys.stderr)
+
+
+def load_matrix_cache() -> Dict[str, Any]:
+    """Load the cached matrix and the digest of the upstream state it reflects."""
+    try:
+        with open(MATRIX_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
 
-        meta = yaml.safe_load(response.text)
+def save_matrix_cache(digest: str, extensions: List[Dict[str, Any]]) -> None:
+    """Persist the generated matrix keyed by its upstream-state digest."""
+    try:
+        os.makedirs(os.path.dirname(MATRIX_CACHE_PATH), exist_ok=True)
+        with open(MATRIX_CACHE_PATH, "w") as f:
+            json.dump({"digest": digest, "extensions": extensions}, f)
+    except OSError as e:
+        print(f"Warning: Could not save matrix cache to {MATRIX_CACHE_PATH}: {e}", file=sys.stderr)
+
+
+def compute_matrix_digest(blobs: Dict[str, Dict[str, str]]) -> str:
+    """Digest the upstream state the matrix depends on.
+
+    Covers every repo's ndx-meta.yaml blob SHA plus the inactive list, so
+    any metadata change, added/removed repo, or INACTIVE_EXTENSIONS edit
+    invalidates the cached matrix.
+    """
+    lines = sorted(f"{name}@{blob['oid']}" for name, blob in blobs.items())
+    lines.extend(sorted(INACTIVE_EXTENSIONS))
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+def extract_meta_fields(text: str) -> Optional[Dict[str, str]]:
+    """Extract name/src/pip from flat ndx-meta.yaml text without a YAML parse.
+
+    Returns None if any key is missing, signaling the caller to fall back to
+    a full YAML parse.
+    """
+    fields = {}
+    for key, pattern in META_FIELD_PATTERNS.items():
+        match = pattern.search(text)
+        if match is None:
+            return None
+        fields[key] = match.group(1).strip("\"'")
+    return fields
+
+
+def parse_extension_metadata(text: str, source: str) -> Optional[Dict[str, Any]]:
+    """Parse ndx-meta.yaml content into a matrix entry, or None if invalid."""
+    try:
+        # Fast path: uniform flat files yield the three needed keys by regex;
+        # anything unusual gets the full (libyaml-backed) YAML parse
+        meta = extract_meta_fields(text)
+        if meta is None:
+            meta = yaml.load(text, Loader=YamlLoader)
         extension_name = meta["name"]
         source_repo_url = meta["src"]
         pypi_url = meta["pip"]
 
-        if extension_name in INACTIVE_EXTENSIONS:
-            print(f"Skipping inactive extension '{extension_name}'", file=sys.stderr)
-            return None
+    except yaml.YAMLError as e:
+        print(f"Warning: Could not parse YAML from {source}: {e}", file=sys.stderr)
+        return None
 
-        return {
-            "name": extension_name,
-            "repository": source_repo_url,
-            "pypi": pypi_url,
-        }
+    except Exception as e:
+        print(f"Warning: Unexpected error processing {source}: {e}", file=sys.stderr)
+        return None
+
+    return {
+        "name": extension_name,
+        "repository": source_repo_url,
+        "pypi": pypi_url,
+    }
+
+
+def filter_inactive_extension(extension_info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return the matrix entry, or None if the extension is marked inactive.
+
+    The filter is applied per run rather than baked into cached entries so
+    that edits to INACTIVE_EXTENSIONS take effect immediately.
+    """
+    if extension_info and extension_info["name"] in INACTIVE_EXTENSIONS:
+        print(f"Skipping inactive extension '{extension_info['name']}'", file=sys.stderr)
+        return None
+    return extension_info
+
+
+def query_meta_blobs(
+    repo_names: List[str],
+    session: requests.Session,
+    include_text: bool,
+) -> Dict[str, Dict[str, str]]:
+    """Query each repo's ndx-meta.yaml blob via batched GraphQL queries.
+
+    One GraphQL query covers up to GRAPHQL_BATCH_SIZE repositories, so the
+    whole catalog needs only ceil(N / GRAPHQL_BATCH_SIZE) HTTP requests.
+    Returns a mapping of repo name to {"oid": ...} (plus "text" when
+    include_text is set); repos without an ndx-meta.yaml are omitted.
+    """
+    blob_fields = "oid text" if include_text else "oid"
+    blobs = {}
+
+    for start in range(0, len(repo_names), GRAPHQL_BATCH_SIZE):
+        batch = repo_names[start:start + GRAPHQL_BATCH_SIZE]
+
+        # Alias each repository so one query covers the whole batch
+        fields = []
+        for i, name in enumerate(batch):
+            fields.append(
+                f'repo{i}: repository(owner: "nwb-extensions", name: "{name}") '
+                '{ defaultBranchRef { target { ... on Commit '
+                '{ file(path: "ndx-meta.yaml") { object { ... on Blob '
+                f'{{ {blob_fields} }} }} }} }} }} }} }}'
+            )
+        query = "query { " + " ".join(fields) + " }"
+
+        response = session.post(GRAPHQL_API_URL, json={"query": query})
+        response.raise_for_status()
+        check_rate_limit_headers(response)
+        data = decode_json_response(response)
+
+        if data.get("errors"):
+            raise RuntimeError(f"GraphQL metadata query returned errors: {data['errors']}")
+
+        for i, name in enumerate(batch):
+            node = (data.get("data") or {}).get(f"repo{i}")
+            try:
+                blob = node["defaultBranchRef"]["target"]["file"]["object"]
+            except (KeyError, TypeError):
+                blob = None
+            if not blob or "oid" not in blob:
+                print(f"Warning: No ndx-meta.yaml found for {name}", file=sys.stderr)
+                continue
+            blobs[name] = blob
+
+    return blobs
+
+
+def fetch_extensions_via_graphql(
+    repos: List[Dict[str, Any]],
+    session: requests.Session,
+) -> List[Dict[str, Any]]:
+    """Fetch extension metadata for all repos via batched GraphQL queries.
+
+    A cheap oid-only query first establishes a digest of upstream state; if
+    it matches the cached matrix, the matrix is reused without fetching or
+    parsing any file contents. Otherwise blob texts are fetched only for
+    blobs not already in the SHA-keyed parse cache.
+    """
+    repo_names = [repo["name"] for repo in repos]
+    blobs = query_meta_blobs(repo_names, session, include_text=False)
+
+    # Warm-run short circuit: identical blob SHAs and inactive list mean the
+    # cached matrix is still exact
+    digest = compute_matrix_digest(blobs)
+    matrix_cache = load_matrix_cache()
+    if matrix_cache.get("digest") == digest:
+        print("Upstream metadata unchanged; reusing cached matrix", file=sys.stderr)
+        return matrix_cache["extensions"]
+
+    blob_cache = load_blob_cache()
+    cache_dirty = False
+
+    # Fetch texts only for blobs whose parse is not already cached
+    missing = [name for name, blob in blobs.items() if blob["oid"] not in blob_cache]
+    if missing:
+        texts = query_meta_blobs(missing, session, include_text=True)
+        for name, blob in texts.items():
+            extension_info = parse_extension_metadata(blob["text"], name)
+            if extension_info:
+                blob_cache[blob["oid"]] = extension_info
+                cache_dirty = True
+
+    extensions = []
+    for name in repo_names:
+        blob = blobs.get(name)
+        if blob is None:
+            continue
+        extension_info = filter_inactive_extension(blob_cache.get(blob["oid"]))
+        if extension_info:
+            extensions.append(extension_info)
+
+    if cache_dirty:
+        save_blob_cache(blob_cache)
+
+    # Persist the matrix only if every queried blob produced an entry;
+    # caching a truncated matrix under this digest would pin it until some
+    # blob SHA happens to change
+    if all(blob["oid"] in blob_cache for blob in blobs.values()):
+        save_matrix_cache(digest, extensions)
+
+    return extensions
+
+
+def fetch_extension_metadata(repo: Dict[str, Any], session: requests.Session) -> Optional[Dict[str, Any]]:
+    """Fetch extension metadata from ndx-meta.yaml file."""
+    repo_name = repo["name"]
+    repo_url = repo["html_url"]
+    default_branch = repo.get("default_branch", "main")
+
+    raw_url = f"https://raw.githubusercontent.com/nwb-extensions/{repo_name}/{default_branch}/ndx-meta.yaml"
+
+    try:
+        # Public raw files need no token, and anonymous requests stay
+        # CDN-edge-cacheable; merging Authorization as None drops the
+        # session-level header for this host only
+        response = session.get(raw_url, headers={"Authorization": None})
+        response.raise_for_status()
 
     except requests.RequestException as e:
         print(f"Warning: Could not fetch metadata from {raw_url}: {e}", file=sys.stderr)
         return None
 
-    except yaml.YAMLError as e:
-        print(f"Warning: Could not parse YAML from {raw_url}: {e}", file=sys.stderr)
-        return None
+    return filter_inactive_extension(parse_extension_metadata(response.text, raw_url))
 
-    except Exception as e:
-        print(f"Warning: Unexpected error processing {raw_url}: {e}", file=sys.stderr)
-        return None
+
+def iter_active_repos(repos: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield repos whose derived extension name is not known inactive.
+
+    Record repo names follow "{extension_name}-record", so known-inactive
+    extensions can be skipped before spending any fetch on their metadata.
+    The post-parse check in filter_inactive_extension stays as a backstop.
+    """
+    for repo in repos:
+        derived_name = repo["name"][:-len("-record")]
+        if derived_name in INACTIVE_EXTENSIONS:
+            print(f"Skipping inactive extension '{derived_name}'", file=sys.stderr)
+        else:
+            yield repo
 
 
 def fetch_extensions_from_catalog() -> List[Dict[str, Any]]:
     """Fetch all extensions from the NWB extensions catalog."""
-    try:
-        repos = get_extension_record_repos()
-    except Exception as e:
-        print(f"Error: Failed to fetch repository list: {e}", file=sys.stderr)
-        return []
+    # One pooled session for all synchronous calls so TCP+TLS connections to
+    # GitHub are reused instead of handshaking per request
+    session = make_cached_session()
+
+    if "Authorization" in session.headers:
+        # The batched GraphQL query needs the complete listing up front to
+        # digest upstream state, so no listing/fetch overlap on this path
+        try:
+            repos = list(iter_active_repos(get_extension_record_repos(session)))
+        except Exception as e:
+            print(f"Error: Failed to fetch repository list: {e}", file=sys.stderr)
+            return []
 
-    headers = get_github_headers()
+        try:
+            extensions = fetch_extensions_via_graphql(repos, session)
+            print(f"Successfully fetched {len(extensions)} extensions from catalog", file=sys.stderr)
+            return extensions
+        except (requests.RequestException, RuntimeError, ValueError, KeyError) as e:
+            print(f"Warning: GraphQL fetch failed, falling back to raw fetches: {e}", file=sys.stderr)
+        repo_iter = iter(repos)
+    else:
+        # Stream the listing so metadata fetches start as soon as the first
+        # page of repos arrives, overlapping listing round trips with
+        # metadata round trips instead of running them back to back
+        repo_iter = iter_active_repos(iter_extension_record_repos(session))
+
+    # Fetch all ndx-meta.yaml files concurrently so total time is bounded by
+    # the slowest fetch rather than the sum of all round trips; the work is
+    # pure network I/O, so threads scale until bandwidth or rate limit binds
+    max_workers = get_metadata_fetch_concurrency(session)
     extensions = []
-    for repo in repos:
-        extension_info = fetch_extension_metadata(repo, headers)
-        if extension_info:
-            extensions.append(extension_info)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        try:
+            for repo in repo_iter:
+                futures.append(executor.submit(fetch_extension_metadata, repo, session))
+        except Exception as e:
+            # A partial listing would silently shrink the matrix; treat it as
+            # a full failure so the fallback list is used instead
+            print(f"Error: Failed to fetch repository list: {e}", file=sys.stderr)
+            for future in futures:
+                future.cancel()
+            return []
+
+        for future in as_completed(futures):
+            try:
+                extension_info = future.result()
+            except Exception as e:
+                print(f"Warning: Metadata fetch failed: {e}", file=sys.stderr)
+                continue
+            if extension_info:
+                extensions.append(extension_info)
 
     print(f"Successfully fetched {len(extensions)} extensions from catalog", file=sys.stderr)
     return extensions
@@ -231,7 +698,7 @@ def main() -> int:
         matrix = generate_matrix()
 
         if args.output_format == "github-actions":
-            matrix_json = json.dumps(matrix, separators=(',', ':'))
+            matrix_json = dump_compact_json(matrix)
             print(f"Generated matrix with {len(matrix['extension'])} extensions")
             print(f"matrix={matrix_json}")
             if 'GITHUB_OUTPUT' in os.environ: